@@ -0,0 +1,29 @@
+"""Add index on nested transformation id of nestings
+
+Revision ID: 966470473115
+Revises: 99f61ce50ad5
+Create Date: 2026-10-16 10:12:41.318524
+
+Finding all workflows which contain a given transformation revision filters the nestings
+table by nested_transformation_id, which is not a prefix of its primary key.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "966470473115"
+down_revision = "99f61ce50ad5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_nestings_nested_transformation_id",
+        "nestings",
+        ["nested_transformation_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_nestings_nested_transformation_id", table_name="nestings")
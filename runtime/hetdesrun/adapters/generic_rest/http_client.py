@@ -0,0 +1,61 @@
+"""Shared http client for sending data to generic rest adapters
+
+Instead of opening a new AsyncClient for every batch of sinks, one client is kept per
+event loop. This allows to reuse pooled keep-alive connections across workflow
+executions instead of paying connection (and TLS) setup each time.
+
+The client is bound to the event loop it is used in, since httpx connections cannot
+be shared between event loops. Only the client of the event loop running the
+application is closed automatically (on application shutdown). Clients created in
+other event loops are never closed automatically, so code running its own event loop
+(e.g. tests) should call close_generic_rest_adapter_client before the loop finishes.
+
+The configuration (hd_adapters_verify_certs and external_request_timeout) is read
+when the client of an event loop is created. Later changes of these settings only
+take effect for a newly created client, i.e. after close_generic_rest_adapter_client
+has been called.
+"""
+
+import asyncio
+import logging
+from weakref import WeakKeyDictionary
+
+import httpx
+
+from hetdesrun.webservice.config import get_config
+
+logger = logging.getLogger(__name__)
+
+GENERIC_REST_ADAPTER_CLIENT_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30
+)
+
+_clients: WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = WeakKeyDictionary()
+
+
+def get_generic_rest_adapter_client() -> httpx.AsyncClient:
+    """Get the shared client for the running event loop
+
+    The client is created on first usage.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        logger.debug("Creating shared http client for generic rest adapters.")
+        client = httpx.AsyncClient(
+            verify=get_config().hd_adapters_verify_certs,
+            timeout=get_config().external_request_timeout,
+            limits=GENERIC_REST_ADAPTER_CLIENT_LIMITS,
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_generic_rest_adapter_client() -> None:
+    """Close the shared client of the running event loop if there is one"""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        logger.debug("Closing shared http client for generic rest adapters.")
+        await client.aclose()
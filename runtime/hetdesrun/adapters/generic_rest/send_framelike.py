@@ -3,10 +3,12 @@
 Common utilities for sending data that is frame-like (tabular), i.e. dataframes as well as
 timeseries (where the later can be understood as special dataframe/table)
 """
+import asyncio
 import base64
 import datetime
 import json
 import logging
+from collections.abc import Mapping
 from posixpath import join as posix_urljoin
 from typing import Any, Literal
 
@@ -20,6 +22,12 @@ from hetdesrun.webservice.auth_outgoing import ServiceAuthenticationError
 
 logger = logging.getLogger(__name__)
 
+# Only status codes for which the adapter cannot have processed the data are retried.
+# 502 and 504 (e.g. from a gateway in front of the adapter) may occur after the data
+# was written, so retrying them could write the same data twice.
+RETRYABLE_STATUS_CODES = (503,)
+RETRY_BACKOFF_SECONDS = 0.5
+
 
 def encode_attributes(df_attrs: Any) -> str:
     df_attrs_json_str = json.dumps(df_attrs)
@@ -31,16 +39,34 @@ def encode_attributes(df_attrs: Any) -> str:
     return base64_str
 
 
+async def wait_before_retry(attempt: int, url: str, ref_id: str, reason: str) -> None:
+    delay = RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1)
+    logger.info(
+        "Retrying to post framelike data to %s for id %s in %s seconds (retry %d). Reason: %s",
+        url,
+        ref_id,
+        delay,
+        attempt,
+        reason,
+    )
+    await asyncio.sleep(delay)
+
+
 async def post_framelike_records(
     list_of_records: list[dict],
     attributes: Any | None,
     ref_id: str,
-    additional_params: list[tuple[str, str]],
+    additional_params: Mapping[str, str] | list[tuple[str, str]],
     adapter_key: str,
     endpoint: Literal["timeseries", "dataframe", "multitsframe"],
     client: AsyncClient,
+    max_retries: int = 0,
 ) -> None:
-    """Post a list of dicts (records) to the appropriate endpoint"""
+    """Post a list of dicts (records) to the appropriate endpoint
+
+    If max_retries is positive, posting is retried with exponential backoff if the
+    adapter cannot be reached or answers with one of the RETRYABLE_STATUS_CODES.
+    """
     try:
         headers = await get_generic_rest_adapter_auth_headers(external=True)
     except ServiceAuthenticationError as e:
@@ -65,21 +91,48 @@ async def post_framelike_records(
         ref_id,
     )
 
-    try:
-        response = await client.post(
-            url,
-            params=[
-                ("timeseriesId" if endpoint == "timeseries" else "id", ref_id),
-                *additional_params,
-            ],
-            json=list_of_records,
-            headers=headers,
-            timeout=60,
+    params: list[tuple[str, str | int | float | bool | None]] = [
+        ("timeseriesId" if endpoint == "timeseries" else "id", ref_id)
+    ]
+    if additional_params:
+        params.extend(
+            additional_params.items()
+            if isinstance(additional_params, Mapping)
+            else additional_params
         )
-    except httpx.HTTPError as e:
-        msg = f"Http error while posting framelike data to {url} for id {ref_id}: {str(e)}"
-        logger.info(msg)
-        raise AdapterConnectionError(msg) from e
+
+    attempt = 0
+    while True:
+        try:
+            response = await client.post(
+                url,
+                params=params,
+                json=list_of_records,
+                headers=headers,
+                timeout=60,
+            )
+        except httpx.HTTPError as e:
+            # only retry if the request cannot have reached the adapter
+            if attempt < max_retries and isinstance(
+                e, httpx.ConnectError | httpx.ConnectTimeout
+            ):
+                attempt += 1
+                await wait_before_retry(attempt, url, ref_id, reason=str(e))
+                continue
+            msg = f"Http error while posting framelike data to {url} for id {ref_id}: {str(e)}"
+            logger.info(msg)
+            raise AdapterConnectionError(msg) from e
+
+        if response.status_code in RETRYABLE_STATUS_CODES and attempt < max_retries:
+            attempt += 1
+            await wait_before_retry(
+                attempt,
+                url,
+                ref_id,
+                reason=f"Status code {str(response.status_code)}",
+            )
+            continue
+        break
 
     if response.status_code not in (200, 201):
         msg = (
@@ -1,5 +1,6 @@
 import asyncio
 import datetime
+from collections.abc import Mapping
 
 import numpy as np
 import pandas as pd
@@ -7,12 +8,29 @@ import pytz
 from httpx import AsyncClient
 
 from hetdesrun.adapters.exceptions import AdapterOutputDataError
+from hetdesrun.adapters.generic_rest.http_client import (
+    get_generic_rest_adapter_client,
+)
 from hetdesrun.adapters.generic_rest.send_framelike import post_framelike_records
 from hetdesrun.datatypes import MULTITSFRAME_COLUMN_NAMES
 from hetdesrun.models.data_selection import FilteredSink
 from hetdesrun.webservice.config import get_config
 
 
+def native_values(column: pd.Series) -> list:
+    """Values of a column as list of Python builtin objects
+
+    Like DataFrame.to_dict, numpy scalars contained in object columns are converted,
+    so that the resulting records are json serializable.
+    """
+    values: list = column.tolist()
+    if column.dtype == object:
+        return [
+            value.item() if isinstance(value, np.generic) else value for value in values
+        ]
+    return values
+
+
 def multitsframe_to_list_of_dicts(df: pd.DataFrame) -> list[dict]:
     if not isinstance(df, pd.DataFrame):
         raise AdapterOutputDataError(
@@ -31,45 +49,68 @@ def multitsframe_to_list_of_dicts(df: pd.DataFrame) -> list[dict]:
             f"the column names required for a MultiTSFrame {multitsframe_column_names_string}."
         )
 
-    if df["metric"].isna().any():
+    if df["metric"].hasnans:
         raise AdapterOutputDataError(
             "Received Pandas Dataframe with null values in the column 'metric'."
         )
 
-    if df["timestamp"].isna().any():
+    timestamps = df["timestamp"]
+    if timestamps.hasnans:
         raise AdapterOutputDataError(
             "Received Pandas Dataframe with null values in the column 'timestamp'."
         )
 
-    if not isinstance(df["timestamp"].dtype, pd.DatetimeTZDtype):
+    timestamp_dtype = timestamps.dtype
+    if not isinstance(timestamp_dtype, pd.DatetimeTZDtype):
         raise AdapterOutputDataError(
             "Column 'timestamp' of the received Pandas Dataframe does not have DatetimeTZDtype "
             "dtype index as expected for generic rest adapter multitsframe endpoints. "
-            f'Got {str(df["timestamp"].dtype)} index dtype instead.'
+            f"Got {str(timestamp_dtype)} index dtype instead."
         )
 
-    if not df["timestamp"].dt.tz in (pytz.UTC, datetime.timezone.utc):
+    if not timestamp_dtype.tz in (pytz.UTC, datetime.timezone.utc):
         raise AdapterOutputDataError(
             "Column 'timestamp' of the received Pandas Dataframe does not have UTC timezone "
             "but generic rest adapter only accepts UTC timeseries data. "
-            f'Got {str(df["timestamp"].dt.tz)} timezone instead.'
+            f"Got {str(timestamp_dtype.tz)} timezone instead."
         )
 
-    new_df = df.replace({np.nan: None})
-    new_df["timestamp"] = new_df["timestamp"].apply(
-        lambda x: x.strftime(
-            "%Y-%m-%dT%H:%M:%S.%f"
-        )  # Generic Rest datetime format is yyyy-MM-ddTHH:mm:ss.SSSSSSSSSX
-        + "{:03d}".format(x.nanosecond)  # noqa: UP032
+    # Only columns actually containing null values need to be converted to object
+    # dtype with None entries, all other columns are shared with the original frame.
+    new_df = df.copy(deep=False)
+    for position, (_, column) in enumerate(df.items()):
+        if column.hasnans:
+            values = column.to_numpy(dtype=object, copy=True)
+            values[column.isna().to_numpy()] = None
+            new_df.isetitem(position, values)
+
+    # Generic Rest datetime format is yyyy-MM-ddTHH:mm:ss.SSSSSSSSSX
+    # Format whole seconds and the nanosecond fraction separately in a vectorized
+    # way instead of calling strftime per row.
+    nanoseconds_of_second = pd.Series(
+        timestamps.astype("datetime64[ns, UTC]").array.asi8 % 1_000_000_000,
+        index=df.index,
+    )
+    new_df["timestamp"] = (
+        timestamps.dt.strftime("%Y-%m-%dT%H:%M:%S")
+        + "."
+        + nanoseconds_of_second.astype(str).str.zfill(9)
         + "Z"  # we guaranteed UTC time zone some lines above!
     )
-    return new_df.to_dict(orient="records")  # type: ignore
+
+    column_names = new_df.columns.tolist()
+    return [
+        dict(zip(column_names, row, strict=True))
+        for row in zip(
+            *(native_values(column) for _, column in new_df.items()), strict=True
+        )
+    ]
 
 
 async def post_multitsframe(
     df: pd.DataFrame,
     ref_id: str,
-    additional_params: list[tuple[str, str]],
+    additional_params: Mapping[str, str] | list[tuple[str, str]],
     adapter_key: str,
     client: AsyncClient,
 ) -> None:
@@ -83,6 +124,7 @@ async def post_multitsframe(
         adapter_key=adapter_key,
         endpoint="multitsframe",
         client=client,
+        max_retries=get_config().hd_adapters_post_retries,
     )
 
 
@@ -91,23 +133,38 @@ async def post_multitsframes(
     ref_ids: list[str],
     sink_filters: list[dict[str, str]],
     adapter_key: str,
+    max_concurrency: int | None = None,
 ) -> None:
-    async with AsyncClient(
-        verify=get_config().hd_adapters_verify_certs,
-        timeout=get_config().external_request_timeout,
-    ) as client:
-        await asyncio.gather(
-            *(
-                post_multitsframe(
-                    df,
-                    ref_id,
-                    additional_params=list(filters.items()),
-                    adapter_key=adapter_key,
-                    client=client,
-                )
-                for df, ref_id, filters in zip(dfs, ref_ids, sink_filters, strict=True)
+    """Post multiple MultiTSFrames concurrently
+
+    At most max_concurrency requests are running at the same time. If not provided,
+    this is taken from the runtime config.
+    """
+    client = get_generic_rest_adapter_client()
+    semaphore = asyncio.Semaphore(
+        max_concurrency
+        if max_concurrency is not None
+        else get_config().hd_adapters_max_concurrent_requests
+    )
+
+    async def post_limited(
+        df: pd.DataFrame, ref_id: str, filters: dict[str, str]
+    ) -> None:
+        async with semaphore:
+            await post_multitsframe(
+                df,
+                ref_id,
+                additional_params=filters,
+                adapter_key=adapter_key,
+                client=client,
             )
+
+    await asyncio.gather(
+        *(
+            post_limited(df, ref_id, filters)
+            for df, ref_id, filters in zip(dfs, ref_ids, sink_filters, strict=True)
         )
+    )
 
 
 async def send_multitsframes_to_adapter(
@@ -115,10 +172,13 @@ async def send_multitsframes_to_adapter(
     data_to_send: dict[str, pd.DataFrame],
     adapter_key: str,
 ) -> None:
-    keys = filtered_sinks.keys()
-    ref_ids: list[str] = [str(filtered_sinks[key].ref_id) for key in keys]
-    sink_filters: list[dict[str, str]] = [filtered_sinks[key].filters for key in keys]
-    dfs = [data_to_send[key] for key in keys]
+    ref_ids: list[str] = []
+    sink_filters: list[dict[str, str]] = []
+    dfs: list[pd.DataFrame] = []
+    for key, filtered_sink in filtered_sinks.items():
+        ref_ids.append(str(filtered_sink.ref_id))
+        sink_filters.append(filtered_sink.filters)
+        dfs.append(data_to_send[key])
 
     await post_multitsframes(
         dfs, ref_ids=ref_ids, sink_filters=sink_filters, adapter_key=adapter_key
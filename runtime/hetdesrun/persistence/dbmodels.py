@@ -8,6 +8,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     UniqueConstraint,
@@ -125,6 +126,9 @@ class NestingDBModel(Base):
             """,
             name="_via_ids_equal_nested_ids_for_direct_nesting_cc",
         ),
+        # lookups of workflows containing a transformation revision,
+        # lookups by workflow_id are covered by the primary key
+        Index("ix_nestings_nested_transformation_id", "nested_transformation_id"),
     )
 
 
@@ -13,6 +13,9 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
 
 from hetdesrun import VERSION
+from hetdesrun.adapters.generic_rest.http_client import (
+    close_generic_rest_adapter_client,
+)
 from hetdesrun.adapters.kafka.config import get_kafka_adapter_config
 from hetdesrun.adapters.sql_adapter.config import get_sql_adapter_config
 from hetdesrun.backend.service.adapter_router import adapter_router
@@ -94,6 +97,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:  # noqa: ARG001
         logger.info("Shutting down Kafka consumer...")
         kakfa_worker_context = get_kafka_worker_context()
         await kakfa_worker_context.stop()
+    await close_generic_rest_adapter_client()
 
 
 def app_desc_part() -> str:
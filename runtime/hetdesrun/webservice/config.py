@@ -379,6 +379,26 @@ class RuntimeConfig(BaseSettings):
     hd_adapters_verify_certs: bool = Field(
         True, env="HETIDA_DESIGNER_ADAPTERS_VERIFY_CERTS"
     )
+    hd_adapters_max_concurrent_requests: int = Field(
+        32,
+        env="HETIDA_DESIGNER_ADAPTERS_MAX_CONCURRENT_REQUESTS",
+        gt=0,
+        description=(
+            "Maximal number of concurrent requests for sending data of one execution"
+            " to a generic rest adapter."
+        ),
+    )
+    hd_adapters_post_retries: int = Field(
+        2,
+        env="HETIDA_DESIGNER_ADAPTERS_POST_RETRIES",
+        ge=0,
+        description=(
+            "How often sending data to a generic rest adapter is retried (with"
+            " exponential backoff) if the adapter could not be reached or answered"
+            " with status code 503. Other errors are not retried, since the data may"
+            " already have been written."
+        ),
+    )
 
     hd_kafka_consumption_mode: None | ExecByIdBase = Field(
         None,
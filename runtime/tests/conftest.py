@@ -4,16 +4,33 @@ from typing import Any
 from unittest import mock
 
 import pytest
+import pytest_asyncio
 from fastapi import FastAPI
 from httpx import AsyncClient
 from sqlalchemy.future.engine import Engine
 
+from hetdesrun.adapters.generic_rest.http_client import (
+    close_generic_rest_adapter_client,
+)
 from hetdesrun.persistence import get_db_engine, sessionmaker
 from hetdesrun.persistence.dbmodels import Base
 from hetdesrun.utils import get_uuid_from_seed
 from hetdesrun.webservice.application import init_app
 
 
+@pytest_asyncio.fixture
+async def close_shared_generic_rest_adapter_client() -> AsyncGenerator:
+    yield
+    await close_generic_rest_adapter_client()
+
+
+@pytest.fixture(autouse=True)
+def _close_shared_generic_rest_adapter_client(request: pytest.FixtureRequest) -> None:
+    # Only async tests have an event loop in which the shared client can be created
+    if request.node.get_closest_marker("asyncio") is not None:
+        request.getfixturevalue("close_shared_generic_rest_adapter_client")
+
+
 @pytest.fixture(scope="session")
 def test_db_engine(use_in_memory_db: bool) -> Engine:
     if use_in_memory_db:
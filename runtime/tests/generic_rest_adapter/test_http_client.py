@@ -0,0 +1,21 @@
+import pytest
+
+from hetdesrun.adapters.generic_rest.http_client import (
+    close_generic_rest_adapter_client,
+    get_generic_rest_adapter_client,
+)
+
+
+@pytest.mark.asyncio
+async def test_generic_rest_adapter_client_is_shared_until_closed() -> None:
+    client = get_generic_rest_adapter_client()
+    assert get_generic_rest_adapter_client() is client
+
+    await close_generic_rest_adapter_client()
+    assert client.is_closed
+
+    new_client = get_generic_rest_adapter_client()
+    assert new_client is not client
+    assert not new_client.is_closed
+
+    await close_generic_rest_adapter_client()
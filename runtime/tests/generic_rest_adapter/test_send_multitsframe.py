@@ -1,13 +1,23 @@
+import asyncio
+from collections.abc import Generator
 from unittest import mock
 
+import httpx
 import numpy as np
 import pandas as pd
 import pytest
 
-from hetdesrun.adapters.exceptions import AdapterOutputDataError
+from hetdesrun.adapters.exceptions import (
+    AdapterConnectionError,
+    AdapterOutputDataError,
+)
 from hetdesrun.adapters.generic_rest import send_data
 from hetdesrun.adapters.generic_rest.external_types import ExternalType
 from hetdesrun.adapters.generic_rest.load_framelike import decode_attributes
+from hetdesrun.adapters.generic_rest.send_multitsframe import (
+    multitsframe_to_list_of_dicts,
+    post_multitsframes,
+)
 from hetdesrun.models.data_selection import FilteredSink
 
 
@@ -259,3 +269,166 @@ async def test_end_to_end_send_only_multitsframe_data() -> None:
                 {"outp_9": mtsf_9},
                 adapter_key="test_end_to_end_send_only_multitsframe_data",
             )
+
+
+def test_multitsframe_to_list_of_dicts_keeps_nanosecond_precision() -> None:
+    mtsf = pd.DataFrame(
+        {
+            "metric": ["a", "a", "b"],
+            "timestamp": [
+                pd.Timestamp("2019-08-01T15:45:36.123456789Z"),
+                pd.Timestamp("2019-08-01T15:45:37.000000001Z"),
+                pd.Timestamp("1969-12-31T23:59:59.5Z"),
+            ],
+            "value": [1.0, 2.0, 3.0],
+        }
+    )
+
+    records = multitsframe_to_list_of_dicts(mtsf)
+
+    assert [record["timestamp"] for record in records] == [
+        "2019-08-01T15:45:36.123456789Z",
+        "2019-08-01T15:45:37.000000001Z",
+        "1969-12-31T23:59:59.500000000Z",
+    ]
+
+
+def single_row_multitsframe() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "metric": ["a"],
+            "timestamp": [pd.Timestamp("2019-08-01T15:45:36Z")],
+            "value": [1.0],
+        }
+    )
+
+
+@pytest.fixture()
+def mocked_adapter_post() -> Generator[mock.AsyncMock, None, None]:
+    post_mock = mock.AsyncMock(return_value=mock.Mock(status_code=200))
+    with mock.patch(  # noqa: SIM117
+        "hetdesrun.adapters.generic_rest.send_framelike.get_generic_rest_adapter_base_url",
+        return_value="https://hetida.de",
+    ), mock.patch(
+        "hetdesrun.adapters.generic_rest.send_multitsframe.AsyncClient.post",
+        new=post_mock,
+    ):
+        yield post_mock
+
+
+@pytest.fixture()
+def two_retries_without_delay() -> Generator[mock.AsyncMock, None, None]:
+    sleep_mock = mock.AsyncMock()
+    with mock.patch(  # noqa: SIM117
+        "hetdesrun.adapters.generic_rest.send_framelike.asyncio.sleep",
+        new=sleep_mock,
+    ), mock.patch(
+        "hetdesrun.webservice.config.runtime_config.hd_adapters_post_retries",
+        new=2,
+    ):
+        yield sleep_mock
+
+
+@pytest.mark.asyncio
+async def test_send_multitsframe_retries_if_adapter_is_unavailable(
+    mocked_adapter_post: mock.AsyncMock, two_retries_without_delay: mock.AsyncMock
+) -> None:
+    mocked_adapter_post.side_effect = [
+        mock.Mock(status_code=503),
+        mock.Mock(status_code=200),
+    ]
+
+    await send_data(
+        {"outp": FilteredSink(ref_id="sink_id", type="multitsframe")},
+        {"outp": single_row_multitsframe()},
+        adapter_key="test_send_multitsframe_retries_if_adapter_is_unavailable",
+    )
+
+    assert mocked_adapter_post.call_count == 2
+    two_retries_without_delay.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_send_multitsframe_retries_if_adapter_cannot_be_reached(
+    mocked_adapter_post: mock.AsyncMock, two_retries_without_delay: mock.AsyncMock
+) -> None:
+    mocked_adapter_post.side_effect = [
+        httpx.ConnectError("connection refused"),
+        httpx.ConnectTimeout("timed out"),
+        mock.Mock(status_code=200),
+    ]
+
+    await send_data(
+        {"outp": FilteredSink(ref_id="sink_id", type="multitsframe")},
+        {"outp": single_row_multitsframe()},
+        adapter_key="test_send_multitsframe_retries_if_adapter_cannot_be_reached",
+    )
+
+    assert mocked_adapter_post.call_count == 3
+    assert two_retries_without_delay.await_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status_code", [502, 504])
+async def test_send_multitsframe_does_not_retry_on_gateway_errors(
+    mocked_adapter_post: mock.AsyncMock,
+    two_retries_without_delay: mock.AsyncMock,
+    status_code: int,
+) -> None:
+    mocked_adapter_post.return_value = mock.Mock(status_code=status_code, text="")
+
+    with pytest.raises(AdapterConnectionError, match=f"Status code: {status_code}"):
+        await send_data(
+            {"outp": FilteredSink(ref_id="sink_id", type="multitsframe")},
+            {"outp": single_row_multitsframe()},
+            adapter_key="test_send_multitsframe_does_not_retry_on_gateway_errors",
+        )
+
+    assert mocked_adapter_post.call_count == 1
+    two_retries_without_delay.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_send_multitsframe_fails_if_retries_are_exhausted(
+    mocked_adapter_post: mock.AsyncMock, two_retries_without_delay: mock.AsyncMock
+) -> None:
+    mocked_adapter_post.return_value = mock.Mock(status_code=503, text="")
+
+    with pytest.raises(AdapterConnectionError, match="Status code: 503"):
+        await send_data(
+            {"outp": FilteredSink(ref_id="sink_id", type="multitsframe")},
+            {"outp": single_row_multitsframe()},
+            adapter_key="test_send_multitsframe_fails_if_retries_are_exhausted",
+        )
+
+    assert mocked_adapter_post.call_count == 3
+    assert two_retries_without_delay.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_post_multitsframes_limits_concurrent_requests(
+    mocked_adapter_post: mock.AsyncMock,
+) -> None:
+    running = 0
+    max_running = 0
+
+    async def post(*args, **kwargs):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return mock.Mock(status_code=200)
+
+    mocked_adapter_post.side_effect = post
+
+    await post_multitsframes(
+        [single_row_multitsframe() for _ in range(4)],
+        ref_ids=["sink_id_1", "sink_id_2", "sink_id_3", "sink_id_4"],
+        sink_filters=[{}, {}, {}, {}],
+        adapter_key="test_post_multitsframes_limits_concurrent_requests",
+        max_concurrency=1,
+    )
+
+    assert mocked_adapter_post.call_count == 4
+    assert max_running == 1